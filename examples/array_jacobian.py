@@ -0,0 +1,25 @@
+# Example: computing a full Jacobian matrix in a single reverse sweep
+import numpy as np
+from autodiff.array import Function, var, d
+
+# Create a vector variable and a matrix variable
+x = var(np.array([1, 2, 3]))
+m = var(np.array([[1, 2, 3], [4, 5, 6]]))
+
+# Assign the matrix-vector product to a new variable
+y = var(m @ x)
+
+# Create the function f : (x, m) ↦ y = m @ x
+f = Function(y)
+
+# Seed the target with the identity matrix and pull it back once.
+# Derivatives are propagated as whole matrices, so a single sweep
+# yields all Jacobian rows - no loop over output components needed.
+f.pull_gradient_at(y)
+
+print("∂y/∂x =\n", d(x))  # ∂y/∂x =
+                          #  [[1. 2. 3.]
+                          #   [4. 5. 6.]]
+print("∂y/∂m =\n", d(m))  # ∂y/∂m =
+                          #  [[1. 0. 2. 0. 3. 0.]
+                          #   [0. 1. 0. 2. 0. 3.]]
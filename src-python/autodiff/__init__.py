@@ -23,5 +23,7 @@ scalar
     Automatic differentiation for scalars only
 array
     Automatic differentiation for scalars, 1D and 2D NumPy arrays
+array32
+    Single-precision (`np.float32`) variant of the array module
 """
 __version__ = "0.1.0"
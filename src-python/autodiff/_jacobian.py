@@ -0,0 +1,66 @@
+"""
+Shared implementation of the `jacobian` convenience function.
+
+The array modules use incompatible internal representations, so each
+of them creates its own `jacobian` bound to its own differential
+getter `d`.
+"""
+
+import numpy as np
+
+
+def make_jacobian(d):
+    """Create the `jacobian` function for a module with getter `d`."""
+
+    def jacobian(function, target, sources, mode="auto"):
+        """Compute the Jacobian matrices of a target with respect to sources.
+
+        Runs forward- or reverse-mode differentiation on `function`,
+        seeding the sources or the target, respectively.
+
+        Parameters
+        ----------
+        function : Function
+            The function to differentiate.
+        target : Variable
+            The target variable. Must be a target of `function`.
+        sources : tuple of Variable
+            The source variables to differentiate with respect to.
+            Must be sources of `function`.
+        mode : {'auto', 'forward', 'reverse'}, optional
+            In 'auto' mode (default), forward mode is chosen when the
+            combined size of the sources does not exceed the size of
+            the target, and reverse mode otherwise.
+
+        Returns
+        -------
+        list of np.ndarray
+            The Jacobian matrix of `target` with respect to each
+            source, in the order given by `sources`.
+
+        Note
+        ----
+        Before calling this, the function must be evaluated, either
+        eagerly during expression construction or by calling
+        `evaluate`.
+
+        Raises
+        ------
+        ValueError
+            If `mode` is not one of 'auto', 'forward', 'reverse'.
+        """
+        if mode == "auto":
+            source_size = sum(np.size(source()) for source in sources)
+            mode = "forward" if source_size <= np.size(target()) else "reverse"
+        if mode == "forward":
+            jacobians = []
+            for source in sources:
+                function.push_tangent_at(source)
+                jacobians.append(np.copy(d(target)))
+            return jacobians
+        if mode == "reverse":
+            function.pull_gradient_at(target)
+            return [np.copy(d(source)) for source in sources]
+        raise ValueError(f"unknown differentiation mode: {mode!r}")
+
+    return jacobian
@@ -11,6 +11,12 @@ Function
     Lets you evaluate and differentiate a program defined by
     variables and expressions.
 
+Convenience functions
+---------------------
+jacobian
+    Computes Jacobian matrices, choosing automatically between
+    forward- and reverse-mode differentiation.
+
 Variable classes
 ----------------
 ScalarVariable
@@ -57,6 +63,10 @@ minimum
     Element-wise minimum of an expression and zero.
 maximum
     Element-wise maximum of an expression and zero.
+sigmoid
+    Logistic sigmoid function, element-wise.
+softplus
+    Softplus function, element-wise.
 dot
     Dot product of two vectors.
 outer
@@ -108,12 +118,17 @@ in AutoDiff. But 1⨉N arrays are treated as matrices.
 
 from autodiff._array import __version__
 from autodiff._array import *
+from autodiff._jacobian import make_jacobian
+
+jacobian = make_jacobian(d)
+del make_jacobian
 
 __all__ = [
     "Function",
     "Variable",
     "var",
     "d",
+    "jacobian",
     "ScalarExpression",
     "ScalarOperation",
     "ScalarVariable",
@@ -130,7 +145,9 @@ __all__ = [
     "sqrt",
     "square",
     "minimum",
-    "maximum"
+    "maximum",
+    "sigmoid",
+    "softplus",
     "dot",
     "outer",
     "matmul",
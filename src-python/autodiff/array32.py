@@ -0,0 +1,69 @@
+"""
+AutoDiff for NumPy arrays, single precision
+===========================================
+
+This module provides automatic differentiation for scalar and
+(1D and 2D) NumPy array computations in single precision.
+
+It mirrors the API of `autodiff.array`, but all values and derivatives
+are stored as `np.float32` instead of `np.float64`. This halves the
+memory traffic of large array computations and doubles the number of
+elements processed per SIMD instruction, at the cost of reduced
+precision (roughly seven significant decimal digits).
+
+>>> x = var(np.array([1., 2., 3.], dtype=np.float32))
+
+>>> x()            # np.float32 values
+
+Arrays of other dtypes are converted to `np.float32` on assignment.
+
+Note
+----
+Variables and expressions from this module cannot be mixed with those
+from `autodiff.array` or `autodiff.scalar`, as they use incompatible
+internal representations.
+
+See `autodiff.array` for the documentation of the available variable
+classes and operations.
+"""
+
+from autodiff._array32 import __version__
+from autodiff._array32 import *
+from autodiff._jacobian import make_jacobian
+
+jacobian = make_jacobian(d)
+del make_jacobian
+
+__all__ = [
+    "Function",
+    "Variable",
+    "var",
+    "d",
+    "jacobian",
+    "ScalarExpression",
+    "ScalarOperation",
+    "ScalarVariable",
+    "VectorExpression",
+    "VectorOperation",
+    "VectorVariable",
+    "MatrixExpression",
+    "MatrixOperation",
+    "MatrixVariable",
+    "sin",
+    "cos",
+    "exp",
+    "log",
+    "sqrt",
+    "square",
+    "minimum",
+    "maximum",
+    "sigmoid",
+    "softplus",
+    "dot",
+    "outer",
+    "matmul",
+    "sum",
+    "mean",
+    "norm",
+    "squared_norm",
+]
@@ -41,6 +41,13 @@ minimum
     Minimum of a scalar expression and zero.
 maximum
     Maximum of a scalar expression and zero.
+sigmoid
+    Logistic sigmoid function, 1 / (1 + exp(-x)).
+softplus
+    Softplus function, log(1 + exp(x)).
+
+Composite operations such as `sigmoid` are fused: they evaluate as a
+single expression instead of one intermediate result per operation.
 """
 
 from autodiff._scalar import __version__
@@ -62,4 +69,6 @@ __all__ = [
     "square",
     "minimum",
     "maximum",
+    "sigmoid",
+    "softplus",
 ]
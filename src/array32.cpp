@@ -0,0 +1,27 @@
+// Copyright (c) 2024 Matthias Krippner
+//
+// This software is released under the MIT License.
+// https://opensource.org/licenses/MIT
+
+#include "common.hpp"
+#include "composite.hpp"
+
+#include <AutoDiff/Eigen>
+#include <AutoDiff/Python/ExpressionBinding.hpp>
+#include <pybind11/eigen.h>
+#include <pybind11/pybind11.h>
+
+PYBIND11_MODULE(MODULE_NAME, module)
+{
+    module.attr("__version__") = VERSION_INFO;
+    // the module docstring is added directly to
+    // `src-python/autodiff/array32.py`
+
+    defCore(module); // must be called before ExpressionBinding
+
+    using Real   = float;
+    using Vector = Eigen::VectorXf;
+    using Matrix = Eigen::MatrixXf;
+
+#include "array_bindings.ipp"
+}
@@ -0,0 +1,59 @@
+// Copyright (c) 2024 Matthias Krippner
+//
+// This software is released under the MIT License.
+// https://opensource.org/licenses/MIT
+
+#ifndef SRC_COMPOSITE_HPP
+#define SRC_COMPOSITE_HPP
+
+/*
+ * Composite element-wise operations.
+ *
+ * Each function composes core expressions before the result is
+ * type-erased by the binding. The whole chain therefore becomes a
+ * single node in the Python-facing graph and is evaluated (and
+ * differentiated) in one fused pass, instead of materializing one
+ * intermediate variable per operation.
+ *
+ * The compositions below avoid the naive forms 1 / (1 + exp(-x)) and
+ * log(1 + exp(x)), whose exp overflows for large |x| and turns the
+ * value into inf and the gradient into NaN. With |x| written as
+ * max(x, 0) - min(x, 0), every exponent argument stays non-positive.
+ *
+ * Both compositions depend on min/max only through |x|, with the
+ * linear part carried by x itself. At x = 0 the two |x| terms have
+ * opposite sensitivities (±|x|'/2), so the chain rule cancels the
+ * core's subgradient choice for min/max and yields the smooth
+ * derivatives sigmoid'(0) = 1/4 and softplus'(0) = 1/2 exactly.
+ */
+
+namespace composite {
+
+// |x|, composed as max(x, 0) - min(x, 0)
+template <typename Expr>
+auto abs(Expr x)
+{
+    return max(x) - min(x);
+}
+
+// logistic sigmoid: 1 / (1 + exp(-x))
+//
+// composed as exp((x - |x|) / 2 - log(1 + exp(-|x|)))
+template <typename Real = double, typename Expr>
+auto sigmoid(Expr x)
+{
+    return exp(Real{0.5} * (x - abs(x)) - log(Real{1} + exp(-abs(x))));
+}
+
+// softplus: log(1 + exp(x)), a smooth approximation of `maximum`
+//
+// composed as (x + |x|) / 2 + log(1 + exp(-|x|))
+template <typename Real = double, typename Expr>
+auto softplus(Expr x)
+{
+    return Real{0.5} * (x + abs(x)) + log(Real{1} + exp(-abs(x)));
+}
+
+} // namespace composite
+
+#endif // SRC_COMPOSITE_HPP
@@ -10,7 +10,7 @@
 #include <AutoDiff/src/Core/Expression.hpp> // ValueType
 #include <AutoDiff/src/internal/traits.hpp> // Evaluated
 
-#include <memory>
+#include <optional>
 #include <type_traits> // enable_if_t
 #include <utility>     // move
 
@@ -60,15 +60,15 @@ public:
 
     [[nodiscard]] auto value() -> Value const& final
     {
-        mValuePtr = std::make_unique<Value>(mExpression._value());
-        return *mValuePtr;
+        // assignment reuses the cache storage on re-evaluation
+        mValue = mExpression._value();
+        return *mValue;
     }
 
     [[nodiscard]] auto pushForward() -> Derivative const& final
     {
-        mDerivativePtr
-            = std::make_unique<Derivative>(mExpression._pushForward());
-        return *mDerivativePtr;
+        mDerivative = mExpression._pushForward();
+        return *mDerivative;
     }
 
     void pullBack(Derivative const& gradient) final
@@ -78,8 +78,8 @@ public:
 
     void releaseCache() final
     {
-        mValuePtr.reset();
-        mDerivativePtr.reset();
+        mValue.reset();
+        mDerivative.reset();
         mExpression._releaseCache();
     }
 
@@ -87,8 +87,8 @@ private:
     Expr mExpression;
 
     // cache
-    std::unique_ptr<Value> mValuePtr;
-    std::unique_ptr<Derivative> mDerivativePtr;
+    std::optional<Value> mValue;
+    std::optional<Derivative> mDerivative;
 };
 
 template <typename Var>
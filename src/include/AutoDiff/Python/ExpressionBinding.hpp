@@ -19,7 +19,7 @@
 
 namespace AutoDiff::Python {
 
-template <typename Value_, typename Derivative>
+template <typename Value_, typename Derivative, typename Scalar_ = double>
 struct ExpressionBinding {
     using Value     = Value_;
     using Expr      = Python::Expression<Value, Derivative>;
@@ -29,7 +29,7 @@ struct ExpressionBinding {
     using OpClass   = pybind11::class_<Op, Expr>;
     using VarClass  = pybind11::class_<Var, Expr, AbstractVariable>;
 
-    using Scalar     = double;
+    using Scalar     = Scalar_;
     using ScalarExpr = Python::Expression<Scalar, Derivative>;
 
     ExpressionBinding(pybind11::module& module, std::string const& name)
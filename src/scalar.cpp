@@ -4,6 +4,7 @@
 // https://opensource.org/licenses/MIT
 
 #include "common.hpp"
+#include "composite.hpp"
 
 #include <AutoDiff/Basic>
 #include <AutoDiff/Python/ExpressionBinding.hpp>
@@ -32,7 +33,11 @@ PYBIND11_MODULE(MODULE_NAME, module)
     AUTODIFF_PYTHON_DEF_UNARY_OP(Binding, module, "log", log, "")
     AUTODIFF_PYTHON_DEF_UNARY_OP(Binding, module, "maximum", max, "")
     AUTODIFF_PYTHON_DEF_UNARY_OP(Binding, module, "minimum", min, "")
+    AUTODIFF_PYTHON_DEF_UNARY_OP(
+        Binding, module, "sigmoid", composite::sigmoid, "")
     AUTODIFF_PYTHON_DEF_UNARY_OP(Binding, module, "sin", sin, "")
+    AUTODIFF_PYTHON_DEF_UNARY_OP(
+        Binding, module, "softplus", composite::softplus, "")
     AUTODIFF_PYTHON_DEF_UNARY_OP(Binding, module, "sqrt", sqrt, "")
     AUTODIFF_PYTHON_DEF_UNARY_OP(Binding, module, "square", square, "")
 }
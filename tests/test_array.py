@@ -1,6 +1,9 @@
 import unittest
 import numpy as np
-from autodiff.array import Function, var, d
+from autodiff.array import (
+    Function, var, d, jacobian, maximum, minimum, sigmoid, softplus,
+    dot, mean, norm, sum
+)
 
 class TestArrayProduct(unittest.TestCase):
     def test_eager_evaluation(self):
@@ -51,5 +54,181 @@ class TestArrayProduct(unittest.TestCase):
         assert np.array_equal(d(y), np.diag(xVal))
         assert np.array_equal(d(z), np.identity(3))
 
+class TestInputConversion(unittest.TestCase):
+    def test_integer_input(self):
+        x = var(np.array([1, 2, 3]))
+
+        assert x().dtype == np.float64
+        assert np.array_equal(x(), np.array([1.0, 2.0, 3.0]))
+
+    def test_non_contiguous_input(self):
+        x = var(np.arange(6.0)[::2])  # strided view
+
+        assert np.array_equal(x(), np.array([0.0, 2.0, 4.0]))
+
+    def test_fortran_order_input(self):
+        mVal = np.asfortranarray([[1.0, 2.0], [3.0, 4.0]])
+        m = var(mVal)
+
+        assert m().dtype == np.float64
+        assert np.array_equal(m(), mVal)
+
+class TestArrayReductions(unittest.TestCase):
+    def test_sum(self):
+        xVal = np.array([1.0, 2.0, 3.0])
+
+        x = var(xVal)
+        z = var(sum(x))
+
+        assert z() == 6.0
+
+        f = Function(z)
+        f.pull_gradient_at(z)
+
+        assert np.array_equal(d(x), np.ones((1, 3)))
+
+    def test_mean(self):
+        xVal = np.array([1.0, 2.0, 3.0])
+
+        x = var(xVal)
+        z = var(mean(x))
+
+        assert z() == 2.0
+
+        f = Function(z)
+        f.pull_gradient_at(z)
+
+        assert np.allclose(d(x), np.full((1, 3), 1.0 / 3.0))
+
+    def test_norm(self):
+        xVal = np.array([1.0, 2.0, 3.0])
+
+        x = var(xVal)
+        z = var(norm(x))
+
+        assert z() == np.linalg.norm(xVal)
+
+        f = Function(z)
+        f.pull_gradient_at(z)
+
+        assert np.allclose(d(x), (xVal / np.linalg.norm(xVal)).reshape(1, 3))
+
+    def test_dot(self):
+        xVal = np.array([1.0, 2.0, 3.0])
+        yVal = np.array([4.0, 5.0, 6.0])
+
+        x = var(xVal)
+        y = var(yVal)
+        z = var(dot(x, y))
+
+        assert z() == np.dot(xVal, yVal)
+
+        f = Function(z)
+        f.pull_gradient_at(z)
+
+        assert np.array_equal(d(x), yVal.reshape(1, 3))
+        assert np.array_equal(d(y), xVal.reshape(1, 3))
+
+class TestArrayMinMax(unittest.TestCase):
+    def test_maximum(self):
+        xVal = np.array([-1.5, 0.5, 2.0])
+
+        x = var(xVal)
+        z = var(maximum(x))
+
+        assert np.array_equal(z(), np.maximum(xVal, 0.0))
+
+        f = Function(z)
+        f.pull_gradient_at(z)
+
+        assert np.array_equal(d(x), np.diag(np.where(xVal > 0.0, 1.0, 0.0)))
+
+    def test_minimum(self):
+        xVal = np.array([-1.5, 0.5, 2.0])
+
+        x = var(xVal)
+        z = var(minimum(x))
+
+        assert np.array_equal(z(), np.minimum(xVal, 0.0))
+
+        f = Function(z)
+        f.pull_gradient_at(z)
+
+        assert np.array_equal(d(x), np.diag(np.where(xVal < 0.0, 1.0, 0.0)))
+
+class TestArrayComposites(unittest.TestCase):
+    # ±1000 overflows a naive exp-based composition but must stay
+    # finite; x = 0 must yield the smooth derivative despite the
+    # min/max subgradients in the composition
+    def test_sigmoid(self):
+        xVal = np.array([-1000.0, -2.0, 0.0, 0.5, 3.0, 1000.0])
+
+        x = var(xVal)
+        z = var(sigmoid(x))
+
+        with np.errstate(over="ignore"):
+            sig = 1.0 / (1.0 + np.exp(-xVal))
+
+        assert np.allclose(z(), sig)
+
+        f = Function(z)
+        f.pull_gradient_at(z)
+
+        assert np.allclose(d(x), np.diag(sig * (1.0 - sig)))
+
+    def test_softplus(self):
+        xVal = np.array([-1000.0, -2.0, 0.0, 0.5, 3.0, 1000.0])
+
+        x = var(xVal)
+        z = var(softplus(x))
+
+        assert np.allclose(z(), np.maximum(xVal, 0.0)
+                                + np.log1p(np.exp(-np.abs(xVal))))
+
+        f = Function(z)
+        f.pull_gradient_at(z)
+
+        # the derivative of softplus is the sigmoid
+        with np.errstate(over="ignore"):
+            sig = 1.0 / (1.0 + np.exp(-xVal))
+
+        assert np.allclose(d(x), np.diag(sig))
+
+class TestJacobian(unittest.TestCase):
+    def test_modes_agree(self):
+        xVal = np.array([0.5, 1.0, 2.0])
+        yVal = np.array([-2.5, 1.0, 3.0])
+
+        x = var(xVal)
+        y = var(yVal)
+        z = var(x * y)
+
+        f = Function(z)
+
+        expected = [np.diag(yVal), np.diag(xVal)]
+        for mode in ("auto", "forward", "reverse"):
+            jacobians = jacobian(f, z, sources=(x, y), mode=mode)
+            assert len(jacobians) == len(expected)
+            for result, expect in zip(jacobians, expected):
+                assert np.array_equal(result, expect)
+
+class TestMatrixProduct(unittest.TestCase):
+    def test_reverse_mode_differentiation(self):
+        xVal = np.array([[1., 2.], [3., 4.]])
+        yVal = np.array([[5., 6., 7.], [8., 9., 10.]])
+
+        x = var(xVal)
+        y = var(yVal)
+        u = var(x @ y)
+
+        f = Function(u)
+        f.pull_gradient_at(u)
+
+        # matrices are flattened column-wise, so
+        # vec(x @ y) = (yᵀ ⊗ I₂) vec(x) = (I₃ ⊗ x) vec(y)
+        assert np.array_equal(d(u), np.identity(6))
+        assert np.array_equal(d(x), np.kron(yVal.T, np.identity(2)))
+        assert np.array_equal(d(y), np.kron(np.identity(3), xVal))
+
 if __name__ == '__main__':
     unittest.main()
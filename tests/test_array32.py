@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+from autodiff.array32 import Function, var, d
+
+class TestArray32Product(unittest.TestCase):
+    def test_eager_evaluation(self):
+        xVal = np.array([0.5, 1.0, 2.0], dtype=np.float32)
+        yVal = np.array([-2.5, 1.0, 3.0], dtype=np.float32)
+
+        x = var(xVal)
+        y = var(yVal)
+        z = var(x * y)
+
+        assert z().dtype == np.float32
+        assert np.array_equal(x(), xVal)
+        assert np.array_equal(y(), yVal)
+        assert np.array_equal(z(), xVal * yVal)
+
+    def test_reverse_mode_differentiation(self):
+        xVal = np.array([0.5, 1.0, 2.0], dtype=np.float32)
+        yVal = np.array([-2.5, 1.0, 3.0], dtype=np.float32)
+
+        x = var(xVal)
+        y = var(yVal)
+        z = var(x * y)
+
+        f = Function(z)
+        f.pull_gradient_at(z)
+
+        assert d(x).dtype == np.float32
+        assert np.array_equal(d(x), np.diag(yVal))
+        assert np.array_equal(d(y), np.diag(xVal))
+        assert np.array_equal(d(z), np.identity(3, dtype=np.float32))
+
+class TestInputConversion(unittest.TestCase):
+    def test_integer_input(self):
+        x = var(np.array([1, 2, 3]))
+
+        assert x().dtype == np.float32
+        assert np.array_equal(x(), np.array([1.0, 2.0, 3.0], dtype=np.float32))
+
+    def test_float64_input(self):
+        x = var(np.array([0.5, 1.0, 2.0]))  # np.float64 by default
+
+        assert x().dtype == np.float32
+        assert np.array_equal(x(), np.array([0.5, 1.0, 2.0], dtype=np.float32))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
+import math
 import unittest
-from autodiff.scalar import Function, var, d
+from autodiff.scalar import Function, var, d, sigmoid, softplus
 
 class TestScalarProduct(unittest.TestCase):
     def test_eager_evaluation(self):
@@ -51,5 +52,85 @@ class TestScalarProduct(unittest.TestCase):
         assert d(y) == xVal
         assert d(z) == 1.0
 
+class TestScalarComposites(unittest.TestCase):
+    def test_sigmoid(self):
+        # x = 0 checks that the min/max subgradients cancel: d(x) = 0.25
+        for xVal in (-2.0, 0.0, 0.5, 3.0):
+            x = var(xVal)
+            z = var(sigmoid(x))
+
+            sig = 1.0 / (1.0 + math.exp(-xVal))
+            assert math.isclose(z(), sig)
+
+            f = Function(z)
+            f.pull_gradient_at(z)
+
+            assert math.isclose(d(x), sig * (1.0 - sig))
+
+    def test_sigmoid_is_stable(self):
+        x = var(-1000.0)  # exp(1000) would overflow
+        z = var(sigmoid(x))
+
+        assert z() == 0.0
+
+        f = Function(z)
+        f.pull_gradient_at(z)
+
+        assert d(x) == 0.0  # not NaN
+
+    def test_softplus(self):
+        # x = 0 checks that the min/max subgradients cancel: d(x) = 0.5
+        for xVal in (-2.0, 0.0, 0.5, 3.0):
+            x = var(xVal)
+            z = var(softplus(x))
+
+            assert math.isclose(z(), math.log1p(math.exp(xVal)))
+
+            f = Function(z)
+            f.pull_gradient_at(z)
+
+            # the derivative of softplus is the sigmoid
+            assert math.isclose(d(x), 1.0 / (1.0 + math.exp(-xVal)))
+
+    def test_softplus_is_stable(self):
+        x = var(1000.0)  # exp(1000) would overflow
+        z = var(softplus(x))
+
+        assert z() == 1000.0
+
+        f = Function(z)
+        f.pull_gradient_at(z)
+
+        assert d(x) == 1.0  # not NaN
+
+class TestFunctionCompilation(unittest.TestCase):
+    def test_explicit_compilation(self):
+        x = var(1.5)
+        y = var(-2.5)
+        z = var(x * y)
+
+        f = Function(z)
+        assert not f.compiled()
+
+        f.compile()
+        assert f.compiled()
+
+        f.pull_gradient_at(z)
+        assert d(x) == -2.5
+        assert d(y) == 1.5
+
+    def test_recompile_after_reassignment(self):
+        x = var(3.0)
+        u = var(x * 2)
+
+        f = Function(u)
+        f.evaluate()
+        assert u() == 6.0
+
+        u.set(x ** 2)
+        f.compile()  # required after changing the program
+        f.evaluate()
+        assert u() == 9.0
+
 if __name__ == '__main__':
     unittest.main()